@@ -68,8 +68,7 @@ with tab1:
             if json_input.strip().startswith("{"):
                 data = json.loads(json_input)
             else:
-                # Build from manual inputs
-                import math
+                # Build from manual inputs; engineered features are computed by the API
                 data = {
                     "Time": int(time_val),
                     "Amount": float(amount),
@@ -78,14 +77,7 @@ with tab1:
                     "V11": 0, "V12": 0, "V13": 0, "V14": 0, "V15": 0,
                     "V16": 0, "V17": 0, "V18": 0, "V19": 0, "V20": 0,
                     "V21": 0, "V22": 0, "V23": 0, "V24": 0, "V25": 0,
-                    "V26": 0, "V27": 0, "V28": 0,
-                    "amount_zscore": (amount - 88) / 250 if amount > 0 else 0,
-                    "amount_log": math.log(amount + 1) if amount > 0 else 0,
-                    "v1_v2_ratio": abs(v1 / (v2 + 0.0001)) if v2 != 0 else 0,
-                    "high_value": 1.0 if amount > 1000 else 0.0,
-                    "variance_all": 0.5,
-                    "max_abs_v": max(abs(v1), abs(v2), abs(v3), abs(v4), abs(v5)),
-                    "mean_abs_v": (abs(v1) + abs(v2) + abs(v3) + abs(v4) + abs(v5)) / 5
+                    "V26": 0, "V27": 0, "V28": 0
                 }
             
             # API call
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Benchmark: float64 vs float32 inference path
+Compares preprocessing + scoring time and model-input memory on large batches
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import IsolationForest
+from sklearn.preprocessing import StandardScaler
+from xgboost import XGBClassifier
+
+from src.utils.feature_engineering import FeatureEngineer, RAW_FEATURES, MODEL_FEATURES
+from src.utils.preprocessing import PreprocessingPipeline
+
+
+def make_raw(n, rng):
+    df = pd.DataFrame(rng.normal(size=(n, len(RAW_FEATURES))), columns=RAW_FEATURES)
+    df['Time'] = rng.integers(0, 172800, size=n).astype(float)
+    df['Amount'] = rng.exponential(88.0, size=n).round(2)
+    return df
+
+
+def best_of(fn, repeats=5):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def main(batch_sizes=(1_000, 100_000, 1_000_000)):
+    rng = np.random.default_rng(42)
+    train = make_raw(20_000, rng)
+    y = (train['V1'] + 0.5 * train['V2'] + rng.normal(size=len(train)) > 2).astype(int)
+
+    engineer = FeatureEngineer().fit(train)
+    scaler = StandardScaler().fit(engineer.transform(train))
+    X_train = scaler.transform(engineer.transform(train))
+    iso = IsolationForest(n_estimators=150, random_state=42, n_jobs=-1).fit(X_train)
+    xgb = XGBClassifier(n_estimators=300, max_depth=7, n_jobs=-1).fit(X_train, y)
+
+    print(f"\n{'batch':>10} | {'dtype':>7} | {'input MB':>8} | {'prep ms':>8} | {'score ms':>9}")
+    print("-" * 56)
+
+    for n in batch_sizes:
+        raw = make_raw(n, rng)[RAW_FEATURES].to_numpy()
+
+        for dtype in (np.float64, np.float32):
+            pipeline = PreprocessingPipeline(scaler, MODEL_FEATURES, engineer, dtype=dtype)
+
+            def prep():
+                return pipeline.scale_features(engineer.transform(raw.astype(dtype), dtype=dtype))
+
+            X = prep()
+            prep_ms = best_of(prep)
+            score_ms = best_of(
+                lambda: (iso.score_samples(X), xgb.predict_proba(X)), repeats=3
+            )
+            print(f"{n:>10,} | {np.dtype(dtype).name:>7} | {X.nbytes / 1e6:>8.1f} | "
+                  f"{prep_ms:>8.1f} | {score_ms:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
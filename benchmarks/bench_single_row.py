@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Benchmark: single-row preprocessing latency
+Compares preprocess() with the preallocated preprocess_one() fast path
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import StandardScaler
+
+from src.utils.feature_engineering import FeatureEngineer, RAW_FEATURES, MODEL_FEATURES
+from src.utils.preprocessing import PreprocessingPipeline
+
+
+def latencies_us(fn, record, n=20_000):
+    timings = np.empty(n)
+    for i in range(n):
+        start = time.perf_counter()
+        fn(record)
+        timings[i] = time.perf_counter() - start
+    return timings * 1e6
+
+
+def main():
+    rng = np.random.default_rng(42)
+    df = pd.DataFrame(rng.normal(size=(1000, len(RAW_FEATURES))), columns=RAW_FEATURES)
+    df['Amount'] = rng.exponential(88.0, size=1000)
+
+    engineer = FeatureEngineer().fit(df)
+    scaler = StandardScaler().fit(engineer.transform(df))
+    pipeline = PreprocessingPipeline(scaler, MODEL_FEATURES, engineer)
+    record = df.iloc[0].to_dict()
+
+    print(f"\n{'path':>16} | {'p50 us':>7} | {'p99 us':>7}")
+    print("-" * 36)
+    for name, fn in [("preprocess", pipeline.preprocess), ("preprocess_one", pipeline.preprocess_one)]:
+        timings = latencies_us(fn, record)
+        print(f"{name:>16} | {np.percentile(timings, 50):>7.1f} | {np.percentile(timings, 99):>7.1f}")
+
+
+if __name__ == "__main__":
+    main()
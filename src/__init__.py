@@ -5,7 +5,7 @@ __init__.py - Package initialization
 __version__ = "1.0.0"
 __author__ = "Fraud Detection Team"
 
-from src.data.clean_transform import FeatureEngineer
+from src.utils.feature_engineering import FeatureEngineer
 from src.data.data_pipeline import DataProcessor
 from src.model.train import ModelTrainer, IsolationForestModel, XGBoostModel
 from src.model.ensemble_predictor import EnsemblePredictor
@@ -2,12 +2,14 @@
 FastAPI application for fraud detection model serving
 """
 import logging
+import os
 import time
 import sys
 from pathlib import Path
 from contextlib import asynccontextmanager
 from typing import List
 
+import numpy as np
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import HTMLResponse
@@ -26,11 +28,16 @@ from api.schemas import (
 from model.model_loader import ModelLoader
 from model.ensemble_predictor import EnsemblePredictor
 from utils.preprocessing import PreprocessingPipeline
+from utils.feature_engineering import FeatureEngineer
+from utils.velocity_store import VelocityFeatureStore, VELOCITY_FEATURES
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Set INFERENCE_DTYPE=float32 to halve memory traffic on large batches
+INFERENCE_DTYPE = os.getenv("INFERENCE_DTYPE", "float64")
+
 # Global variables for models
 model_loader: ModelLoader = None
 ensemble_predictor: EnsemblePredictor = None
@@ -56,10 +63,25 @@ async def lifespan(app: FastAPI):
         # Initialize ensemble predictor
         ensemble_predictor = EnsemblePredictor(model_loader.models)
         
+        # Engineered features are computed server-side when training stats exist
+        try:
+            feature_engineer = FeatureEngineer(**model_loader.load_feature_stats())
+        except FileNotFoundError:
+            logger.warning("Feature stats not found, expecting engineered features in requests")
+            feature_engineer = None
+        
+        # Velocity features are only kept for models trained with them
+        velocity_store = None
+        if set(VELOCITY_FEATURES) & set(model_loader.feature_names):
+            velocity_store = VelocityFeatureStore()
+        
         # Initialize preprocessing pipeline
         preprocessing_pipeline = PreprocessingPipeline(
             scaler=model_loader.scaler,
-            feature_names=model_loader.feature_names
+            feature_names=model_loader.feature_names,
+            feature_engineer=feature_engineer,
+            velocity_store=velocity_store,
+            dtype=INFERENCE_DTYPE
         )
         
         logger.info("Models loaded successfully!")
@@ -338,14 +360,7 @@ async def root():
                 "V3": 0, "V4": 0, "V5": 0, "V6": 0, "V7": 0, "V8": 0, "V9": 0, "V10": 0,
                 "V11": 0, "V12": 0, "V13": 0, "V14": 0, "V15": 0, "V16": 0, "V17": 0,
                 "V18": 0, "V19": 0, "V20": 0, "V21": 0, "V22": 0, "V23": 0, "V24": 0,
-                "V25": 0, "V26": 0, "V27": 0, "V28": 0,
-                "amount_zscore": (parseFloat(document.getElementById('amount').value) - 88) / 250,
-                "amount_log": Math.log(parseFloat(document.getElementById('amount').value) + 1),
-                "v1_v2_ratio": Math.abs(parseFloat(document.getElementById('v1').value) / (parseFloat(document.getElementById('v2').value) + 0.0001)),
-                "high_value": parseFloat(document.getElementById('amount').value) > 1000 ? 1 : 0,
-                "variance_all": 0.5,
-                "max_abs_v": 1,
-                "mean_abs_v": 0.5
+                "V25": 0, "V26": 0, "V27": 0, "V28": 0
             };
             
             try {
@@ -425,7 +440,7 @@ async def predict(request: PredictionRequest) -> PredictionResponse:
     try:
         # Preprocess input
         request_dict = request.model_dump()
-        X = preprocessing_pipeline.preprocess(request_dict)
+        X = preprocessing_pipeline.preprocess_one(request_dict)
         
         # Get predictions
         prediction = ensemble_predictor.predict(X)[0]
@@ -455,25 +470,24 @@ async def predict_batch(request: BatchPredictionRequest) -> BatchPredictionRespo
     
     try:
         start_time = time.time()
-        predictions = []
         
-        for sample in request.samples:
-            # Preprocess input
-            sample_dict = sample.model_dump()
-            X = preprocessing_pipeline.preprocess(sample_dict)
-            
-            # Get predictions
-            prediction = ensemble_predictor.predict(X)[0]
-            probability = ensemble_predictor.predict_proba(X)[0]
-            confidence = max(probability, 1 - probability)
-            
-            predictions.append(
-                PredictionResponse(
-                    prediction=int(prediction),
-                    probability=float(probability),
-                    confidence=float(confidence)
-                )
+        # Preprocess the whole batch at once
+        records = [sample.model_dump() for sample in request.samples]
+        X = preprocessing_pipeline.preprocess_batch(records)
+        
+        # Get predictions
+        labels = ensemble_predictor.predict(X)
+        probabilities = ensemble_predictor.predict_proba(X)
+        confidences = np.maximum(probabilities, 1 - probabilities)
+        
+        predictions = [
+            PredictionResponse(
+                prediction=int(prediction),
+                probability=float(probability),
+                confidence=float(confidence)
             )
+            for prediction, probability, confidence in zip(labels, probabilities, confidences)
+        ]
         
         execution_time = (time.time() - start_time) * 1000
         
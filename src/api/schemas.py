@@ -9,17 +9,55 @@ from enum import Enum
 class PredictionRequest(BaseModel):
     """Schema for fraud prediction request"""
     
-    # Example features - adjust based on your actual features
-    feature_1: float = Field(..., description="Feature 1 value")
-    feature_2: float = Field(..., description="Feature 2 value")
-    feature_3: float = Field(..., description="Feature 3 value")
-    # Add all features from your model
+    Time: float = Field(..., description="Seconds elapsed since the first transaction")
+    V1: float = Field(..., description="PCA component V1")
+    V2: float = Field(..., description="PCA component V2")
+    V3: float = Field(..., description="PCA component V3")
+    V4: float = Field(..., description="PCA component V4")
+    V5: float = Field(..., description="PCA component V5")
+    V6: float = Field(..., description="PCA component V6")
+    V7: float = Field(..., description="PCA component V7")
+    V8: float = Field(..., description="PCA component V8")
+    V9: float = Field(..., description="PCA component V9")
+    V10: float = Field(..., description="PCA component V10")
+    V11: float = Field(..., description="PCA component V11")
+    V12: float = Field(..., description="PCA component V12")
+    V13: float = Field(..., description="PCA component V13")
+    V14: float = Field(..., description="PCA component V14")
+    V15: float = Field(..., description="PCA component V15")
+    V16: float = Field(..., description="PCA component V16")
+    V17: float = Field(..., description="PCA component V17")
+    V18: float = Field(..., description="PCA component V18")
+    V19: float = Field(..., description="PCA component V19")
+    V20: float = Field(..., description="PCA component V20")
+    V21: float = Field(..., description="PCA component V21")
+    V22: float = Field(..., description="PCA component V22")
+    V23: float = Field(..., description="PCA component V23")
+    V24: float = Field(..., description="PCA component V24")
+    V25: float = Field(..., description="PCA component V25")
+    V26: float = Field(..., description="PCA component V26")
+    V27: float = Field(..., description="PCA component V27")
+    V28: float = Field(..., description="PCA component V28")
+    Amount: float = Field(..., description="Transaction amount")
+    card_id: Optional[str] = Field(None, description="Card or account id for velocity features")
+    
+    # Engineered features are computed server-side from training statistics.
+    # They are still accepted so that older clients keep working.
+    amount_zscore: Optional[float] = Field(None, description="Optional, computed server-side from training stats")
+    amount_log: Optional[float] = Field(None, description="Optional, computed server-side from training stats")
+    v1_v2_ratio: Optional[float] = Field(None, description="Optional, computed server-side from training stats")
+    high_value: Optional[float] = Field(None, description="Optional, computed server-side from training stats")
+    variance_all: Optional[float] = Field(None, description="Optional, computed server-side from training stats")
+    max_abs_v: Optional[float] = Field(None, description="Optional, computed server-side from training stats")
+    mean_abs_v: Optional[float] = Field(None, description="Optional, computed server-side from training stats")
     
     class Config:
         example = {
-            "feature_1": 0.5,
-            "feature_2": 0.3,
-            "feature_3": 0.8,
+            "Time": 0.0,
+            "V1": -1.36,
+            "V2": -0.07,
+            "V3": 2.54,
+            "Amount": 149.62,
         }
 
 
@@ -62,5 +100,5 @@ class BatchPredictionResponse(BaseModel):
 
 if __name__ == "__main__":
     # Example usage
-    request = PredictionRequest(feature_1=0.5, feature_2=0.3, feature_3=0.8)
+    request = PredictionRequest(Time=0.0, Amount=149.62, **{f"V{i}": 0.0 for i in range(1, 29)})
     print(request.model_dump_json(indent=2))
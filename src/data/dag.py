@@ -0,0 +1,185 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+
+class Stage:
+    """
+    Pipeline stage with declared input and output artifacts (files or
+    directories). The stage runs again only if the content of its inputs,
+    its params or its outputs changed since the last successful run.
+    """
+
+    def __init__(self, name, func, inputs=(), outputs=(), params=None):
+        self.name = name
+        self.func = func
+        self.inputs = [os.fspath(p) for p in inputs]
+        self.outputs = [os.fspath(p) for p in outputs]
+        self.params = params or {}
+
+
+class DAGRunner:
+    """
+    Incremental, parallel runner for a DAG of Stage objects
+
+    Dependencies come from the artifacts: a stage depends on every stage that
+    outputs one of its inputs. Independent stages run concurrently in a thread
+    pool (the numeric work releases the GIL). Fingerprints and timings are kept
+    in a JSON state file.
+    """
+
+    def __init__(self, stages, state_path="dag_state.json", max_workers=4):
+        self.stages = {stage.name: stage for stage in stages}
+        self.state_path = state_path
+        self.max_workers = max_workers
+        self.dependencies = self._resolve_dependencies()
+        self._lock = threading.Lock()
+        self._state = self._load_state()
+
+    def run(self, force=()):
+        """
+        Run out-of-date stages
+
+        Args:
+            force: Names of stages to run even if up to date
+
+        Returns:
+            Dict of stage name -> {'status': 'ran' | 'skipped', 'seconds': float}
+        """
+        report = {}
+        done = set()
+        pending = set(self.stages)
+        running = {}
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                while pending or running:
+                    ready = [name for name in sorted(pending) if self.dependencies[name] <= done]
+                    for name in ready:
+                        pending.remove(name)
+                        running[executor.submit(self._run_stage, name, name in force)] = name
+
+                    finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        name = running.pop(future)
+                        report[name] = future.result()
+                        done.add(name)
+        finally:
+            # Keep the fingerprints of the stages that succeeded
+            self._save_state()
+
+        total = sum(r['seconds'] for r in report.values())
+        ran = [name for name, r in report.items() if r['status'] == 'ran']
+        print(f"✓ DAG: {len(ran)}/{len(report)} étapes exécutées ({total:.2f}s cumulées)")
+        return report
+
+    def _run_stage(self, name, force):
+        stage = self.stages[name]
+        start = time.perf_counter()
+        fingerprint = self._fingerprint(stage)
+        previous = self._state["stages"].get(name, {})
+
+        up_to_date = (
+            not force
+            and previous.get("fingerprint") == fingerprint
+            and previous.get("outputs") == self._hash_paths(stage.outputs)
+        )
+        if up_to_date:
+            return {"status": "skipped", "seconds": time.perf_counter() - start}
+
+        stage.func()
+        seconds = time.perf_counter() - start
+        with self._lock:
+            self._state["stages"][name] = {
+                "fingerprint": fingerprint,
+                "outputs": self._hash_paths(stage.outputs),
+                "seconds": seconds,
+            }
+        print(f"  {name}: {seconds:.2f}s")
+        return {"status": "ran", "seconds": seconds}
+
+    def _fingerprint(self, stage):
+        digest = hashlib.sha256()
+        digest.update(json.dumps(
+            {"params": stage.params, "inputs": self._hash_paths(stage.inputs)},
+            sort_keys=True, default=str,
+        ).encode())
+        return digest.hexdigest()
+
+    def _hash_paths(self, paths):
+        return {path: self._hash_path(path) for path in paths}
+
+    def _hash_path(self, path):
+        if os.path.isdir(path):
+            digest = hashlib.sha256()
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for file_name in sorted(files):
+                    file_path = os.path.join(root, file_name)
+                    digest.update(os.path.relpath(file_path, path).encode())
+                    digest.update(self._hash_file(file_path).encode())
+            return digest.hexdigest()
+        if os.path.exists(path):
+            return self._hash_file(path)
+        return None
+
+    def _hash_file(self, path):
+        """Content hash, memoized on (size, mtime) to avoid rereading large files"""
+        stat = os.stat(path)
+        key = f"{stat.st_size}:{stat.st_mtime_ns}"
+        with self._lock:
+            cached = self._state["files"].get(path)
+        if cached and cached["key"] == key:
+            return cached["hash"]
+
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        with self._lock:
+            self._state["files"][path] = {"key": key, "hash": digest.hexdigest()}
+        return digest.hexdigest()
+
+    def _resolve_dependencies(self):
+        producers = {}
+        for stage in self.stages.values():
+            for output in stage.outputs:
+                producers[output] = stage.name
+
+        dependencies = {
+            stage.name: {producers[p] for p in stage.inputs if p in producers}
+            for stage in self.stages.values()
+        }
+
+        # Reject cycles
+        visiting, visited = set(), set()
+
+        def visit(name):
+            if name in visiting:
+                raise ValueError(f"Cycle detected at stage '{name}'")
+            if name not in visited:
+                visiting.add(name)
+                for dependency in dependencies[name]:
+                    visit(dependency)
+                visiting.remove(name)
+                visited.add(name)
+
+        for name in dependencies:
+            visit(name)
+        return dependencies
+
+    def _load_state(self):
+        if os.path.exists(self.state_path):
+            with open(self.state_path) as f:
+                return json.load(f)
+        return {"stages": {}, "files": {}}
+
+    def _save_state(self):
+        directory = os.path.dirname(self.state_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.state_path, "w") as f:
+            json.dump(self._state, f, indent=2)
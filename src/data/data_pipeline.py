@@ -1,11 +1,220 @@
-from download_data import download_data
-from clean_transform import clean_transform
-from load_final import load_final
+import json
+import os
+from functools import partial
 
-def run_data_pipeline():
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import StandardScaler
+
+from src.data.dag import DAGRunner, Stage
+from src.data.dataset_cache import DatasetCache, fingerprint
+from src.data.download_data import download_data
+from src.data.ingest import ingest_csv, read_split
+from src.utils.feature_engineering import FeatureEngineer, MODEL_FEATURES
+from src.utils.velocity_store import VelocityFeatureStore, VELOCITY_FEATURES
+
+
+def run_data_pipeline(csv_path=None, output_dir="data_final", work_dir="data_work",
+                      force=(), max_workers=4):
+    """
+    Pipeline complet pour préparer les données, exécuté comme un DAG
+    incrémental : seules les étapes dont les entrées ont changé sont relancées.
+    Le résultat dans work_dir s'ouvre avec ModelTrainer.load_dataset.
+    """
+    if csv_path is None:
+        csv_path = download_data()
+    runner = DAGRunner(
+        build_data_dag(csv_path, output_dir, work_dir),
+        state_path=os.path.join(work_dir, "dag_state.json"),
+        max_workers=max_workers,
+    )
+    return runner.run(force=force)
+
+
+def build_data_dag(csv_path, data_dir="data_final", work_dir="data_work",
+                   test_size=0.2, random_state=42, chunksize=100_000):
+    """
+    Étapes : ingest → feature_stats → features_{train,test} → scaler
+    → scale_{train,test} → manifest. Les branches train et test sont
+    indépendantes et s'exécutent en parallèle.
+    """
+    def out(name):
+        return os.path.join(work_dir, name)
+
+    train_dir, test_dir = os.path.join(data_dir, "train"), os.path.join(data_dir, "test")
+    stats = out("feature_stats.json")
+    scaler = out("scaler.joblib")
+
+    stages = [
+        Stage("ingest",
+              partial(ingest_csv, csv_path, output_dir=data_dir, chunksize=chunksize,
+                      test_size=test_size, random_state=random_state),
+              inputs=[csv_path], outputs=[train_dir, test_dir],
+              params={"test_size": test_size, "random_state": random_state}),
+        Stage("feature_stats", partial(_fit_feature_stats, data_dir, stats),
+              inputs=[train_dir], outputs=[stats]),
+        Stage("scaler", partial(_fit_scaler, out("features_train.npy"), scaler),
+              inputs=[out("features_train.npy")], outputs=[scaler]),
+        Stage("manifest", partial(_write_manifest, out("meta.json")),
+              inputs=[out("X_train_scaled.npy"), out("X_test_scaled.npy")],
+              outputs=[out("meta.json")], params={"features": MODEL_FEATURES}),
+    ]
+    for split, split_dir in (("train", train_dir), ("test", test_dir)):
+        features = out(f"features_{split}.npy")
+        stages += [
+            Stage(f"features_{split}",
+                  partial(_engineer_split, data_dir, split, stats, features, out(f"y_{split}.npy")),
+                  inputs=[split_dir, stats], outputs=[features, out(f"y_{split}.npy")]),
+            Stage(f"scale_{split}",
+                  partial(_scale_split, features, scaler, out(f"X_{split}_scaled.npy")),
+                  inputs=[features, scaler], outputs=[out(f"X_{split}_scaled.npy")]),
+        ]
+    return stages
+
+
+def _fit_feature_stats(data_dir, stats_path):
+    X_train, _ = read_split(data_dir, "train")
+    os.makedirs(os.path.dirname(stats_path), exist_ok=True)
+    FeatureEngineer().fit(X_train).save(stats_path)
+
+
+def _engineer_split(data_dir, split, stats_path, features_path, labels_path):
+    X, y = read_split(data_dir, split)
+    engineer = FeatureEngineer.load(stats_path)
+    np.save(features_path, engineer.transform(X, dtype=np.float32))
+    np.save(labels_path, y.to_numpy(dtype=np.int8))
+
+
+def _fit_scaler(features_path, scaler_path):
+    scaler = StandardScaler().fit(np.load(features_path, mmap_mode="r"))
+    joblib.dump(scaler, scaler_path)
+
+
+def _scale_split(features_path, scaler_path, scaled_path):
+    scaler = joblib.load(scaler_path)
+    X = scaler.transform(np.load(features_path, mmap_mode="r"))
+    np.save(scaled_path, X.astype(np.float32, copy=False))
+
+
+def _write_manifest(meta_path):
+    with open(meta_path, "w") as f:
+        json.dump({"feature_names": MODEL_FEATURES}, f)
+
+
+class DataProcessor:
     """
-    Pipeline complet pour préparer les données.
+    Data preparation for training: ingestion, feature engineering, scaling
     """
-    df = download_data()
-    X_train, X_test, y_train, y_test = clean_transform(df)
-    load_final(X_train, X_test, y_train, y_test)
+
+    def __init__(self, csv_path=None, data_dir="data_final", test_size=0.2,
+                 random_state=42, chunksize=100_000, key_column=None,
+                 cache_dir="data_cache"):
+        """
+        Args:
+            csv_path: Local CSV (downloaded from Kaggle if None)
+            data_dir: Directory of the train/test Parquet partitions
+            test_size: Fraction of each class assigned to the test split
+            random_state: Seed for the split
+            chunksize: Rows per CSV chunk during ingestion
+            key_column: Card/account id column; adds velocity features if set
+            cache_dir: Directory of the float32 dataset cache (None disables it)
+        """
+        self.csv_path = csv_path
+        self.data_dir = data_dir
+        self.test_size = test_size
+        self.random_state = random_state
+        self.chunksize = chunksize
+        self.key_column = key_column
+        self.cache = DatasetCache(cache_dir) if cache_dir else None
+
+        self.feature_engineer = None
+        self.scaler = None
+
+    @property
+    def feature_names(self):
+        if self.key_column is None:
+            return list(MODEL_FEATURES)
+        return MODEL_FEATURES + VELOCITY_FEATURES
+
+    def ingest(self, force=False):
+        """Stream the CSV into Parquet partitions unless already done"""
+        if not force and os.path.isdir(os.path.join(self.data_dir, "train")):
+            return None
+
+        csv_path = self.csv_path or download_data()
+        return ingest_csv(
+            csv_path,
+            output_dir=self.data_dir,
+            chunksize=self.chunksize,
+            test_size=self.test_size,
+            random_state=self.random_state,
+            id_columns=[self.key_column] if self.key_column else (),
+        )
+
+    @property
+    def cache_key(self):
+        """Fingerprint of the raw partitions and feature parameters"""
+        return fingerprint(self.data_dir, {
+            'features': self.feature_names,
+            'key_column': self.key_column,
+        })
+
+    def run(self):
+        """
+        Prepare scaled train/test matrices
+
+        With a cache, an unchanged dataset is opened as memory-mapped float32
+        arrays instead of being preprocessed again.
+        """
+        print("\n📥 Préparation des données...")
+        self.ingest()
+
+        if self.cache is not None:
+            key = self.cache_key
+            if not self.cache.exists(key):
+                self.cache.save(key, self._prepare())
+            data = self.cache.load(key)
+            self.scaler = data['scaler']
+            self.feature_engineer = data['feature_engineer']
+            print(f"✓ Dataset chargé depuis le cache ({key})")
+            return data
+
+        return self._prepare()
+
+    def _prepare(self):
+        X_train, y_train = read_split(self.data_dir, "train")
+        X_test, y_test = read_split(self.data_dir, "test")
+
+        self.feature_engineer = FeatureEngineer().fit(X_train)
+        X_train_feat = self.feature_engineer.transform(X_train, dtype=np.float32)
+        X_test_feat = self.feature_engineer.transform(X_test, dtype=np.float32)
+
+        if self.key_column is not None:
+            velocity = self._velocity_features(X_train, X_test)
+            X_train_feat = np.hstack([X_train_feat, velocity[:len(X_train)]])
+            X_test_feat = np.hstack([X_test_feat, velocity[len(X_train):]])
+
+        self.scaler = StandardScaler()
+        X_train_scaled = self.scaler.fit_transform(X_train_feat)
+        X_test_scaled = self.scaler.transform(X_test_feat)
+
+        print(f"✓ Split: Train {X_train_scaled.shape} | Test {X_test_scaled.shape}")
+
+        return {
+            'X_train_scaled': X_train_scaled,
+            'X_test_scaled': X_test_scaled,
+            'y_train': y_train,
+            'y_test': y_test,
+            'scaler': self.scaler,
+            'feature_engineer': self.feature_engineer,
+            'feature_names': self.feature_names,
+        }
+
+    def _velocity_features(self, X_train, X_test):
+        """Point-in-time velocity features over train and test together"""
+        both = pd.concat([X_train, X_test], ignore_index=True)
+        keys = both[self.key_column].where(both[self.key_column].notna(), None)
+        return VelocityFeatureStore().replay(
+            keys.tolist(), both['Time'].to_numpy(), both['Amount'].to_numpy()
+        ).astype(np.float32)
@@ -0,0 +1,85 @@
+import glob
+import hashlib
+import json
+import os
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from src.utils.feature_engineering import FeatureEngineer
+
+MATRICES = ("X_train_scaled", "X_test_scaled")
+LABELS = ("y_train", "y_test")
+
+
+def fingerprint(data_dir, params):
+    """
+    Empreinte des partitions brutes (nom, taille, date de modification)
+    et des paramètres de feature engineering.
+    """
+    digest = hashlib.sha256()
+    for path in sorted(glob.glob(os.path.join(data_dir, "*", "part-*.parquet"))):
+        stat = os.stat(path)
+        rel = os.path.relpath(path, data_dir)
+        digest.update(f"{rel}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+    digest.update(json.dumps(params, sort_keys=True, default=str).encode())
+    return digest.hexdigest()[:16]
+
+
+class DatasetCache:
+    """
+    Engineered, scaled train/test matrices stored as float32 .npy files
+    """
+
+    def __init__(self, cache_dir="data_cache"):
+        self.cache_dir = cache_dir
+
+    def path(self, key):
+        return os.path.join(self.cache_dir, key)
+
+    def exists(self, key):
+        return os.path.exists(os.path.join(self.path(key), "meta.json"))
+
+    def save(self, key, data):
+        """Write the matrices, labels, scaler and feature stats of a run"""
+        path = self.path(key)
+        os.makedirs(path, exist_ok=True)
+
+        for name in MATRICES:
+            np.save(os.path.join(path, f"{name}.npy"),
+                    np.ascontiguousarray(data[name], dtype=np.float32))
+        for name in LABELS:
+            np.save(os.path.join(path, f"{name}.npy"), np.asarray(data[name], dtype=np.int8))
+
+        joblib.dump(data["scaler"], os.path.join(path, "scaler.joblib"))
+        data["feature_engineer"].save(os.path.join(path, "feature_stats.json"))
+
+        # meta.json is written last: its presence marks a complete entry
+        with open(os.path.join(path, "meta.json"), "w") as f:
+            json.dump({"feature_names": data["feature_names"]}, f)
+        print(f"✓ Dataset mis en cache : {path}")
+
+    def load(self, key, mmap_mode="r"):
+        """Open a cached entry; matrices are memory-mapped by default"""
+        return load_cached_dataset(self.path(key), mmap_mode=mmap_mode)
+
+
+def load_cached_dataset(path, mmap_mode="r"):
+    """
+    Ouvre un dataset en cache : matrices memory-mappées, labels en Series.
+    """
+    with open(os.path.join(path, "meta.json")) as f:
+        meta = json.load(f)
+
+    data = {
+        name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mmap_mode)
+        for name in MATRICES
+    }
+    for name in LABELS:
+        data[name] = pd.Series(np.load(os.path.join(path, f"{name}.npy")), name="Class")
+
+    data["scaler"] = joblib.load(os.path.join(path, "scaler.joblib"))
+    data["feature_engineer"] = FeatureEngineer.load(os.path.join(path, "feature_stats.json"))
+    data["feature_names"] = meta["feature_names"]
+    return data
@@ -1,11 +1,13 @@
-import kagglehub
-import pandas as pd
 import os
 
+
 def download_data():
     """
-    Télécharge la dataset via kagglehub et charge automatiquement le CSV.
+    Télécharge la dataset via kagglehub et retourne le chemin du CSV.
+    Le CSV n'est pas chargé en mémoire : voir ingest.ingest_csv.
     """
+    import kagglehub
+
     # Téléchargement
     path = kagglehub.dataset_download("mlg-ulb/creditcardfraud")
     print("Fichiers téléchargés dans :", path)
@@ -18,10 +20,8 @@ def download_data():
     csv_path = os.path.join(path, csv_files[0])
     print("CSV détecté :", csv_path)
 
-    df = pd.read_csv(csv_path)
-    print("Shape data:", df.shape)
-
-    return df
+    return csv_path
 
 
-df = download_data()
+if __name__ == "__main__":
+    download_data()
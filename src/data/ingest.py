@@ -0,0 +1,77 @@
+import os
+import glob
+
+import numpy as np
+import pandas as pd
+
+
+def ingest_csv(csv_path, output_dir="data_final", chunksize=100_000, test_size=0.2,
+               random_state=42, label_column="Class", id_columns=()):
+    """
+    Lit le CSV par morceaux, convertit en float32 et écrit des partitions
+    Parquet train/test au fil de l'eau.
+
+    Le split est stratifié en streaming : pour chaque classe, la part de
+    lignes envoyées en test reste égale à test_size (à une ligne près).
+    La mémoire utilisée dépend de chunksize, pas de la taille du fichier.
+    Les colonnes de id_columns (ex. identifiant de carte) ne sont pas converties.
+    """
+    rng = np.random.default_rng(random_state)
+    seen = {}
+    assigned_test = {}
+    counts = {"train": 0, "test": 0}
+
+    for split in counts:
+        os.makedirs(os.path.join(output_dir, split), exist_ok=True)
+        for old_part in glob.glob(os.path.join(output_dir, split, "part-*.parquet")):
+            os.remove(old_part)
+
+    reader = pd.read_csv(csv_path, chunksize=chunksize)
+    for part, chunk in enumerate(reader):
+        features = chunk.columns.drop([label_column, *id_columns])
+        chunk = chunk.astype({col: np.float32 for col in features})
+        chunk[label_column] = chunk[label_column].astype(np.int8)
+
+        labels = chunk[label_column].to_numpy()
+        is_test = np.zeros(len(chunk), dtype=bool)
+        for cls in np.unique(labels):
+            rows = np.flatnonzero(labels == cls)
+            n_seen = seen.get(cls, 0) + len(rows)
+            n_test = int(round(n_seen * test_size)) - assigned_test.get(cls, 0)
+            is_test[rng.choice(rows, size=n_test, replace=False)] = True
+            seen[cls] = n_seen
+            assigned_test[cls] = assigned_test.get(cls, 0) + n_test
+
+        for split, mask in (("train", ~is_test), ("test", is_test)):
+            if mask.any():
+                path = os.path.join(output_dir, split, f"part-{part:05d}.parquet")
+                chunk[mask].to_parquet(path, index=False)
+                counts[split] += int(mask.sum())
+
+    print(f"Ingestion terminée : train {counts['train']:,} | test {counts['test']:,}")
+    return {
+        "train_rows": counts["train"],
+        "test_rows": counts["test"],
+        "class_counts": {int(cls): int(n) for cls, n in seen.items()},
+        "test_class_counts": {int(cls): int(n) for cls, n in assigned_test.items()},
+    }
+
+
+def iter_partitions(output_dir, split, columns=None):
+    """
+    Itère sur les partitions Parquet d'un split, une à la fois.
+    """
+    for path in sorted(glob.glob(os.path.join(output_dir, split, "part-*.parquet"))):
+        yield pd.read_parquet(path, columns=columns)
+
+
+def read_split(output_dir, split, label_column="Class"):
+    """
+    Charge un split complet (float32) en X, y.
+    """
+    parts = list(iter_partitions(output_dir, split))
+    if not parts:
+        raise FileNotFoundError(f"Aucune partition trouvée dans {output_dir}/{split}")
+
+    df = pd.concat(parts, ignore_index=True)
+    return df.drop(columns=label_column), df[label_column]
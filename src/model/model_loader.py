@@ -24,6 +24,7 @@ class ModelLoader:
         self.models = {}
         self.scaler = None
         self.feature_names = None
+        self.feature_stats = None
     
     def load_scaler(self) -> Any:
         """
@@ -99,6 +100,24 @@ class ModelLoader:
         logger.info(f"Loaded {len(self.feature_names)} features")
         return self.feature_names
     
+    def load_feature_stats(self) -> Dict[str, float]:
+        """
+        Load feature engineering statistics frozen at training time
+        
+        Returns:
+            Dictionary of FeatureEngineer parameters
+        """
+        stats_path = Path(self.models_dir) / "feature_stats.json"
+        
+        if not stats_path.exists():
+            raise FileNotFoundError(f"Feature stats not found at {stats_path}")
+        
+        with open(stats_path, "r") as f:
+            self.feature_stats = json.load(f)
+        
+        logger.info(f"Feature stats loaded from {stats_path}")
+        return self.feature_stats
+    
     def load_metrics(self) -> Dict[str, Any]:
         """
         Load training metrics
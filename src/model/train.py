@@ -151,6 +151,13 @@ class ModelTrainer:
             'xgb_model': self.xgb_model
         }
     
+    @staticmethod
+    def load_dataset(cache_path):
+        """Open a cached dataset; X matrices are memory-mapped read-only"""
+        from src.data.dataset_cache import load_cached_dataset
+        
+        return load_cached_dataset(cache_path, mmap_mode='r')
+    
     def save_models(self):
         """Save trained models"""
         if self.iso_forest and self.xgb_model:
@@ -0,0 +1,179 @@
+"""
+Feature engineering with statistics frozen at training time
+"""
+import json
+import logging
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Dict, Any, Union
+
+logger = logging.getLogger(__name__)
+
+# Raw columns in the order of the Kaggle creditcard dataset
+RAW_FEATURES = ['Time'] + [f'V{i}' for i in range(1, 29)] + ['Amount']
+
+# Features added by add_anomaly_features in the training notebook
+ENGINEERED_FEATURES = [
+    'amount_zscore',
+    'amount_log',
+    'v1_v2_ratio',
+    'high_value',
+    'variance_all',
+    'max_abs_v',
+    'mean_abs_v',
+]
+
+MODEL_FEATURES = RAW_FEATURES + ENGINEERED_FEATURES
+
+# The notebook computes the variance features on X.iloc[:, :28], i.e. Time and
+# V1-V27. The fitted scaler depends on that, so the same block is kept here.
+_BLOCK = slice(0, 28)
+_V1 = RAW_FEATURES.index('V1')
+_V2 = RAW_FEATURES.index('V2')
+_AMOUNT = RAW_FEATURES.index('Amount')
+
+
+class FeatureEngineer:
+    """Compute the engineered features from raw transactions"""
+
+    def __init__(self, amount_mean: float = None, amount_std: float = None,
+                 amount_q95: float = None):
+        """
+        Initialize feature engineer
+
+        Args:
+            amount_mean: Mean of Amount on the training set
+            amount_std: Standard deviation of Amount on the training set
+            amount_q95: 95th percentile of Amount on the training set
+        """
+        self.amount_mean = amount_mean
+        self.amount_std = amount_std
+        self.amount_q95 = amount_q95
+
+    @property
+    def is_fitted(self) -> bool:
+        return None not in (self.amount_mean, self.amount_std, self.amount_q95)
+
+    def fit(self, X: Union[pd.DataFrame, np.ndarray]) -> "FeatureEngineer":
+        """
+        Freeze Amount statistics from the training set
+
+        Args:
+            X: Raw training features (RAW_FEATURES order if an array)
+
+        Returns:
+            self
+        """
+        amount = self._raw_array(X)[:, _AMOUNT].astype(np.float64)
+
+        self.amount_mean = float(amount.mean())
+        self.amount_std = float(amount.std(ddof=1))
+        self.amount_q95 = float(np.quantile(amount, 0.95))
+
+        logger.info(
+            f"Feature stats frozen: mean={self.amount_mean:.4f}, "
+            f"std={self.amount_std:.4f}, q95={self.amount_q95:.4f}"
+        )
+        return self
+
+    def transform(self, X: Union[pd.DataFrame, np.ndarray], dtype=np.float64) -> np.ndarray:
+        """
+        Compute raw + engineered features for a whole batch
+
+        Args:
+            X: Raw features (RAW_FEATURES order if an array)
+            dtype: Output dtype
+
+        Returns:
+            Array of shape (n_samples, len(MODEL_FEATURES))
+        """
+        raw = self._raw_array(X)
+        out = np.empty((raw.shape[0], len(MODEL_FEATURES)), dtype=dtype)
+        out[:, :len(RAW_FEATURES)] = raw
+        return self.transform_inplace(out)
+
+    def transform_inplace(self, out: np.ndarray) -> np.ndarray:
+        """
+        Fill the engineered columns of a preallocated MODEL_FEATURES array
+
+        Args:
+            out: Array of shape (n_samples, len(MODEL_FEATURES)) whose raw
+                columns are already set
+
+        Returns:
+            out
+        """
+        if not self.is_fitted:
+            raise ValueError("FeatureEngineer not fitted. Call fit() first.")
+
+        n_raw = len(RAW_FEATURES)
+        amount = out[:, _AMOUNT]
+        zscore, log_amount, ratio, high, variance, max_abs, mean_abs = (
+            out[:, n_raw + i] for i in range(len(ENGINEERED_FEATURES))
+        )
+
+        np.subtract(amount, self.amount_mean, out=zscore)
+        np.divide(zscore, self.amount_std, out=zscore)
+        np.abs(zscore, out=zscore)
+        np.log1p(amount, out=log_amount)
+
+        np.add(out[:, _V2], 1e-10, out=ratio)
+        np.divide(out[:, _V1], ratio, out=ratio)
+        np.abs(ratio, out=ratio)
+        np.greater(amount, self.amount_q95, out=high, casting='unsafe')
+
+        block = out[:, _BLOCK]
+        np.var(block, axis=1, ddof=1, out=variance)
+        abs_block = np.abs(block)
+        np.max(abs_block, axis=1, out=max_abs)
+        np.mean(abs_block, axis=1, out=mean_abs)
+
+        return out
+
+    def fit_transform(self, X: Union[pd.DataFrame, np.ndarray], dtype=np.float64) -> np.ndarray:
+        """Fit on X and return its engineered features"""
+        return self.fit(X).transform(X, dtype=dtype)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'amount_mean': self.amount_mean,
+            'amount_std': self.amount_std,
+            'amount_q95': self.amount_q95,
+        }
+
+    def save(self, path: Union[str, Path]):
+        """Save frozen statistics as JSON"""
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+        logger.info(f"Feature stats saved to {path}")
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "FeatureEngineer":
+        """Load frozen statistics from JSON"""
+        with open(path, "r") as f:
+            stats = json.load(f)
+        return cls(**stats)
+
+    @staticmethod
+    def _raw_array(X: Union[pd.DataFrame, np.ndarray]) -> np.ndarray:
+        if isinstance(X, pd.DataFrame):
+            X = X[RAW_FEATURES].to_numpy()
+        X = np.asarray(X)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        if X.shape[1] != len(RAW_FEATURES):
+            raise ValueError(
+                f"Expected {len(RAW_FEATURES)} raw features, got {X.shape[1]}"
+            )
+        return X
+
+
+if __name__ == "__main__":
+    # Example usage
+    rng = np.random.default_rng(42)
+    X_raw = rng.normal(size=(5, len(RAW_FEATURES)))
+    X_raw[:, _AMOUNT] = rng.exponential(88.0, size=5)
+
+    engineer = FeatureEngineer().fit(X_raw)
+    print(engineer.transform(X_raw).shape)
@@ -43,7 +43,8 @@ st.sidebar.markdown("---")
 st.sidebar.info(
     "**Fraud Detection System**\n\n"
     "Upload a JSON or CSV file containing transaction data to check for fraud.\n\n"
-    "Required features: Time, V1-V28, Amount, and engineered features."
+    "Required features: Time, V1-V28 and Amount. "
+    "Engineered features are computed by the API."
 )
 
 # Main title
@@ -84,30 +85,10 @@ with tab1:
                 with cols[i % 4]:
                     v_features[f"V{i+1}"] = st.number_input(f"V{i+1}", value=0.0, key=f"v{i+1}")
             
-            # Engineered features
-            st.markdown("**Engineered Features**")
-            cols = st.columns(2)
-            with cols[0]:
-                amount_zscore = st.number_input("amount_zscore", value=0.0)
-                amount_log = st.number_input("amount_log", value=5.0)
-                v1_v2_ratio = st.number_input("v1_v2_ratio", value=0.0)
-                high_value = st.number_input("high_value", value=0.0)
-            with cols[1]:
-                variance_all = st.number_input("variance_all", value=0.5)
-                max_abs_v = st.number_input("max_abs_v", value=4.4)
-                mean_abs_v = st.number_input("mean_abs_v", value=0.6)
-            
             payload = {
                 "Time": time_val,
                 "Amount": amount,
-                **v_features,
-                "amount_zscore": amount_zscore,
-                "amount_log": amount_log,
-                "v1_v2_ratio": v1_v2_ratio,
-                "high_value": high_value,
-                "variance_all": variance_all,
-                "max_abs_v": max_abs_v,
-                "mean_abs_v": mean_abs_v
+                **v_features
             }
         
         elif input_method == "JSON":
@@ -275,14 +256,7 @@ with tab2:
             "V1": [-1.36, 1.36],
             "V2": [-0.07, 0.07],
             "V3": [2.54, -2.54],
-            "Amount": [100.0, 500.0],
-            "amount_zscore": [0.0, 1.0],
-            "amount_log": [5.0, 6.0],
-            "v1_v2_ratio": [18.32, 19.0],
-            "high_value": [0.0, 1.0],
-            "variance_all": [0.5, 0.6],
-            "max_abs_v": [4.4, 5.0],
-            "mean_abs_v": [0.6, 0.7]
+            "Amount": [100.0, 500.0]
         })
         st.dataframe(sample_df)
         
@@ -0,0 +1,93 @@
+"""
+Tests for the incremental data-pipeline DAG runner
+"""
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data.dag import DAGRunner, Stage
+from src.data.data_pipeline import build_data_dag
+from src.model.train import ModelTrainer
+from src.utils.feature_engineering import RAW_FEATURES, MODEL_FEATURES
+
+
+def copy_stage(name, src, dst, calls):
+    def func():
+        calls.append(name)
+        dst.write_text(src.read_text().upper())
+    return Stage(name, func, inputs=[src], outputs=[dst])
+
+
+def test_only_changed_branches_rerun(tmp_path):
+    calls = []
+    a, b = tmp_path / "a.txt", tmp_path / "b.txt"
+    a.write_text("a")
+    b.write_text("b")
+    stages = [
+        copy_stage("upper_a", a, tmp_path / "A.txt", calls),
+        copy_stage("upper_b", b, tmp_path / "B.txt", calls),
+    ]
+    state = tmp_path / "state.json"
+
+    first = DAGRunner(stages, state_path=state).run()
+    assert sorted(calls) == ["upper_a", "upper_b"]
+    assert all(r["status"] == "ran" and r["seconds"] >= 0 for r in first.values())
+
+    calls.clear()
+    b.write_text("bb")
+    second = DAGRunner(stages, state_path=state).run()
+    assert calls == ["upper_b"]
+    assert second["upper_a"]["status"] == "skipped"
+
+
+def test_unchanged_intermediate_output_stops_propagation(tmp_path):
+    calls = []
+    src, mid, out = tmp_path / "src.txt", tmp_path / "mid.txt", tmp_path / "out.txt"
+    src.write_text("x")
+    stages = [copy_stage("first", src, mid, calls), copy_stage("second", mid, out, calls)]
+    state = tmp_path / "state.json"
+    DAGRunner(stages, state_path=state).run()
+
+    calls.clear()
+    DAGRunner(stages, state_path=state).run(force=["first"])
+
+    assert calls == ["first"]
+
+
+def test_independent_stages_run_in_parallel(tmp_path):
+    barrier = threading.Barrier(2, timeout=5)
+    stages = [
+        Stage("left", barrier.wait, outputs=[tmp_path / "left"]),
+        Stage("right", barrier.wait, outputs=[tmp_path / "right"]),
+    ]
+
+    DAGRunner(stages, state_path=tmp_path / "state.json", max_workers=2).run()
+
+
+def test_cycles_are_rejected(tmp_path):
+    stages = [
+        Stage("a", lambda: None, inputs=[tmp_path / "y"], outputs=[tmp_path / "x"]),
+        Stage("b", lambda: None, inputs=[tmp_path / "x"], outputs=[tmp_path / "y"]),
+    ]
+    with pytest.raises(ValueError, match="Cycle"):
+        DAGRunner(stages, state_path=tmp_path / "state.json")
+
+
+def test_data_dag_builds_a_trainable_dataset(tmp_path):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(size=(1000, len(RAW_FEATURES))), columns=RAW_FEATURES)
+    df['Amount'] = rng.exponential(88.0, size=1000)
+    df['Class'] = (rng.random(1000) < 0.05).astype(int)
+    df.to_csv(tmp_path / "creditcard.csv", index=False)
+    stages = build_data_dag(tmp_path / "creditcard.csv", tmp_path / "parts", tmp_path / "work")
+    state = tmp_path / "work" / "dag_state.json"
+
+    DAGRunner(stages, state_path=state).run()
+    rerun = DAGRunner(stages, state_path=state).run()
+
+    assert {r["status"] for r in rerun.values()} == {"skipped"}
+    data = ModelTrainer.load_dataset(tmp_path / "work")
+    assert data['X_train_scaled'].shape == (800, len(MODEL_FEATURES))
+    assert len(data['y_test']) == 200
@@ -0,0 +1,59 @@
+"""
+Tests for the memory-mapped dataset cache
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data.data_pipeline import DataProcessor
+from src.model.train import ModelTrainer
+from src.utils.feature_engineering import RAW_FEATURES
+
+
+@pytest.fixture
+def processor(tmp_path):
+    rng = np.random.default_rng(0)
+    n = 2000
+    df = pd.DataFrame(rng.normal(size=(n, len(RAW_FEATURES))), columns=RAW_FEATURES)
+    df['Amount'] = rng.exponential(88.0, size=n)
+    df['Class'] = (rng.random(n) < 0.05).astype(int)
+    df.to_csv(tmp_path / "creditcard.csv", index=False)
+
+    return DataProcessor(
+        csv_path=tmp_path / "creditcard.csv",
+        data_dir=tmp_path / "parts",
+        cache_dir=tmp_path / "cache",
+    )
+
+
+def test_second_run_is_served_from_cache(processor, monkeypatch):
+    first = processor.run()
+
+    def fail():
+        raise AssertionError("preprocessing should be skipped")
+    monkeypatch.setattr(processor, "_prepare", fail)
+    second = processor.run()
+
+    assert isinstance(second['X_train_scaled'], np.memmap)
+    assert second['X_train_scaled'].dtype == np.float32
+    np.testing.assert_array_equal(first['X_test_scaled'], second['X_test_scaled'])
+    pd.testing.assert_series_equal(first['y_train'], second['y_train'])
+
+
+def test_cache_key_changes_with_data(processor):
+    processor.run()
+    key = processor.cache_key
+
+    processor.ingest(force=True)
+
+    assert processor.cache_key != key
+
+
+def test_model_trainer_opens_cache_memory_mapped(processor, tmp_path):
+    processor.run()
+
+    data = ModelTrainer.load_dataset(processor.cache.path(processor.cache_key))
+
+    assert isinstance(data['X_train_scaled'], np.memmap)
+    assert not data['X_train_scaled'].flags.writeable
+    assert len(data['X_train_scaled']) == len(data['y_train'])
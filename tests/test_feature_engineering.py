@@ -0,0 +1,88 @@
+"""
+Tests for server-side feature engineering
+"""
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.preprocessing import StandardScaler
+
+from src.utils.feature_engineering import (
+    FeatureEngineer,
+    RAW_FEATURES,
+    ENGINEERED_FEATURES,
+    MODEL_FEATURES,
+)
+from src.utils.preprocessing import PreprocessingPipeline
+
+
+def make_raw(n=200, seed=0):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame(rng.normal(size=(n, len(RAW_FEATURES))), columns=RAW_FEATURES)
+    df['Time'] = np.sort(rng.uniform(0, 172800, size=n))
+    df['Amount'] = rng.exponential(88.0, size=n)
+    return df
+
+
+def add_anomaly_features(X):
+    """Reference implementation from the training notebook"""
+    X_feat = X.copy()
+    X_feat['amount_zscore'] = np.abs((X['Amount'] - X['Amount'].mean()) / X['Amount'].std())
+    X_feat['amount_log'] = np.log1p(X['Amount'])
+    X_feat['v1_v2_ratio'] = np.abs(X['V1'] / (X['V2'] + 1e-10))
+    X_feat['high_value'] = (X['Amount'] > X['Amount'].quantile(0.95)).astype(int)
+    X_feat['variance_all'] = X.iloc[:, :28].var(axis=1)
+    X_feat['max_abs_v'] = np.abs(X.iloc[:, :28]).max(axis=1)
+    X_feat['mean_abs_v'] = np.abs(X.iloc[:, :28]).mean(axis=1)
+    return X_feat
+
+
+def test_matches_notebook_on_training_set():
+    """Fitted on a set, the features equal the notebook's on that set"""
+    df = make_raw()
+    expected = add_anomaly_features(df)[MODEL_FEATURES].to_numpy(dtype=float)
+
+    X = FeatureEngineer().fit_transform(df)
+
+    np.testing.assert_allclose(X, expected, rtol=1e-10, atol=1e-12)
+
+
+def test_features_do_not_depend_on_batch():
+    """Frozen statistics make each row independent of its batch"""
+    df = make_raw()
+    engineer = FeatureEngineer().fit(df)
+
+    batch = engineer.transform(df.iloc[:50])
+    single = engineer.transform(df.iloc[[7]])
+
+    np.testing.assert_array_equal(batch[7], single[0])
+
+
+def test_save_and_load_roundtrip(tmp_path):
+    engineer = FeatureEngineer().fit(make_raw())
+    engineer.save(tmp_path / "feature_stats.json")
+
+    loaded = FeatureEngineer.load(tmp_path / "feature_stats.json")
+
+    assert loaded.to_dict() == engineer.to_dict()
+
+
+def test_transform_requires_fit():
+    with pytest.raises(ValueError):
+        FeatureEngineer().transform(make_raw(5))
+
+
+def test_pipeline_accepts_raw_requests():
+    """Requests only carry raw features when a FeatureEngineer is set"""
+    df = make_raw()
+    engineer = FeatureEngineer().fit(df)
+    scaler = StandardScaler().fit(engineer.transform(df))
+    pipeline = PreprocessingPipeline(
+        scaler=scaler, feature_names=MODEL_FEATURES, feature_engineer=engineer
+    )
+    records = df.iloc[:3].to_dict(orient="records")
+
+    batch = pipeline.preprocess_batch(records)
+    single = pipeline.preprocess(records[1])
+
+    assert batch.shape == (3, len(RAW_FEATURES) + len(ENGINEERED_FEATURES))
+    np.testing.assert_allclose(single[0], batch[1])
@@ -0,0 +1,69 @@
+"""
+Parity tests for the float32 inference path
+"""
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.ensemble import IsolationForest
+from sklearn.preprocessing import StandardScaler
+from xgboost import XGBClassifier
+
+from src.utils.feature_engineering import FeatureEngineer, RAW_FEATURES, MODEL_FEATURES
+from src.utils.preprocessing import PreprocessingPipeline
+
+
+def make_raw(n, rng):
+    df = pd.DataFrame(rng.normal(size=(n, len(RAW_FEATURES))), columns=RAW_FEATURES)
+    df['Time'] = rng.integers(0, 172800, size=n).astype(float)
+    df['Amount'] = rng.exponential(88.0, size=n).round(2)
+    return df
+
+
+@pytest.fixture(scope="module")
+def fitted():
+    rng = np.random.default_rng(0)
+    train = make_raw(3000, rng)
+    y = (train['V1'] + 0.5 * train['V2'] + rng.normal(size=len(train)) > 2).astype(int)
+
+    engineer = FeatureEngineer().fit(train)
+    X = engineer.transform(train)
+    scaler = StandardScaler().fit(X)
+    X_scaled = scaler.transform(X)
+
+    iso = IsolationForest(n_estimators=50, random_state=0).fit(X_scaled)
+    xgb = XGBClassifier(n_estimators=50, max_depth=4, random_state=0).fit(X_scaled, y)
+
+    records = make_raw(2000, rng).to_dict(orient="records")
+    return engineer, scaler, iso, xgb, records
+
+
+def pipelines(engineer, scaler):
+    return (
+        PreprocessingPipeline(scaler, MODEL_FEATURES, engineer),
+        PreprocessingPipeline(scaler, MODEL_FEATURES, engineer, dtype=np.float32),
+    )
+
+
+def test_float32_pipeline_keeps_dtype(fitted):
+    engineer, scaler, _, _, records = fitted
+    p64, p32 = pipelines(engineer, scaler)
+
+    X64 = p64.preprocess_batch(records)
+    X32 = p32.preprocess_batch(records)
+
+    assert X32.dtype == np.float32
+    assert X32.nbytes * 2 == X64.nbytes
+    np.testing.assert_allclose(X32, X64, rtol=1e-5, atol=1e-5)
+
+
+def test_float32_scores_match_float64(fitted):
+    engineer, scaler, iso, xgb, records = fitted
+    p64, p32 = pipelines(engineer, scaler)
+    X64 = p64.preprocess_batch(records)
+    X32 = p32.preprocess_batch(records)
+
+    xgb_diff = np.abs(xgb.predict_proba(X64)[:, 1] - xgb.predict_proba(X32)[:, 1])
+    iso_diff = np.abs(iso.score_samples(X64) - iso.score_samples(X32))
+
+    assert xgb_diff.max() < 1e-5
+    assert iso_diff.max() < 1e-6
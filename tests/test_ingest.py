@@ -0,0 +1,60 @@
+"""
+Tests for chunked CSV ingestion and DataProcessor
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data.ingest import ingest_csv, read_split
+from src.data.data_pipeline import DataProcessor
+from src.utils.feature_engineering import RAW_FEATURES, MODEL_FEATURES
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    rng = np.random.default_rng(0)
+    n = 5000
+    df = pd.DataFrame(rng.normal(size=(n, len(RAW_FEATURES))), columns=RAW_FEATURES)
+    df['Time'] = np.arange(n, dtype=float)
+    df['Amount'] = rng.exponential(88.0, size=n).round(2)
+    df['Class'] = (rng.random(n) < 0.02).astype(int)
+    path = tmp_path / "creditcard.csv"
+    df.to_csv(path, index=False)
+    return path
+
+
+def test_ingest_is_stratified_and_complete(csv_path, tmp_path):
+    out = tmp_path / "parts"
+
+    summary = ingest_csv(csv_path, output_dir=out, chunksize=700, test_size=0.2)
+
+    X_train, y_train = read_split(out, "train")
+    X_test, y_test = read_split(out, "test")
+    original = pd.read_csv(csv_path)
+
+    assert len(X_train) + len(X_test) == len(original)
+    assert summary["test_rows"] == len(X_test)
+    for cls, n in original['Class'].value_counts().items():
+        assert abs((y_test == cls).sum() - 0.2 * n) <= 1
+
+    assert set(X_train.dtypes) == {np.dtype(np.float32)}
+    assert sorted(pd.concat([X_train, X_test])['Time']) == list(original['Time'])
+
+
+def test_ingest_is_deterministic(csv_path, tmp_path):
+    ingest_csv(csv_path, output_dir=tmp_path / "a", chunksize=1000)
+    ingest_csv(csv_path, output_dir=tmp_path / "b", chunksize=1000)
+
+    pd.testing.assert_frame_equal(read_split(tmp_path / "a", "test")[0],
+                                  read_split(tmp_path / "b", "test")[0])
+
+
+def test_data_processor_run(csv_path, tmp_path):
+    processor = DataProcessor(csv_path=csv_path, data_dir=tmp_path / "parts", chunksize=1000)
+
+    data = processor.run()
+
+    assert data['X_train_scaled'].shape[1] == len(MODEL_FEATURES)
+    assert len(data['X_train_scaled']) == len(data['y_train'])
+    assert data['feature_names'] == MODEL_FEATURES
+    np.testing.assert_allclose(data['X_train_scaled'].mean(axis=0), 0, atol=1e-3)
@@ -0,0 +1,78 @@
+"""
+Tests for the single-row preprocessing fast path
+"""
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.preprocessing import StandardScaler
+
+from src.utils.feature_engineering import FeatureEngineer, RAW_FEATURES, MODEL_FEATURES
+from src.utils.preprocessing import PreprocessingPipeline
+
+
+@pytest.fixture(scope="module")
+def data():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(size=(100, len(RAW_FEATURES))), columns=RAW_FEATURES)
+    df['Time'] = rng.integers(0, 172800, size=100).astype(float)
+    df['Amount'] = rng.exponential(88.0, size=100)
+    engineer = FeatureEngineer().fit(df)
+    scaler = StandardScaler().fit(engineer.transform(df))
+    return engineer, scaler, df.to_dict(orient="records")
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_matches_preprocess(data, dtype):
+    engineer, scaler, records = data
+    pipeline = PreprocessingPipeline(scaler, MODEL_FEATURES, engineer, dtype=dtype)
+
+    for record in records[:10]:
+        np.testing.assert_allclose(
+            pipeline.preprocess_one(record), pipeline.preprocess(record), rtol=1e-5, atol=1e-6
+        )
+
+
+def test_matches_preprocess_with_reordered_features(data):
+    engineer, scaler, records = data
+    feature_names = MODEL_FEATURES[::-1]
+    scaler = StandardScaler().fit(
+        PreprocessingPipeline(None, feature_names, engineer).records_to_array(records)
+    )
+    pipeline = PreprocessingPipeline(scaler, feature_names, engineer)
+
+    np.testing.assert_allclose(pipeline.preprocess_one(records[3]), pipeline.preprocess(records[3]))
+
+
+def test_legacy_requests_with_all_features(data):
+    engineer, scaler, records = data
+    record = dict(zip(MODEL_FEATURES, engineer.transform(pd.DataFrame([records[0]]))[0]))
+    pipeline = PreprocessingPipeline(scaler, MODEL_FEATURES)
+
+    np.testing.assert_allclose(pipeline.preprocess_one(record), pipeline.preprocess(record))
+
+
+def test_buffer_is_reused_per_thread(data):
+    engineer, scaler, records = data
+    pipeline = PreprocessingPipeline(scaler, MODEL_FEATURES, engineer)
+
+    first = pipeline.preprocess_one(records[0])
+    second = pipeline.preprocess_one(records[1])
+    assert first is second
+
+    other = []
+    thread = threading.Thread(target=lambda: other.append(pipeline.preprocess_one(records[0])))
+    thread.start()
+    thread.join()
+    assert other[0] is not second
+
+
+def test_missing_feature_raises(data):
+    engineer, scaler, records = data
+    pipeline = PreprocessingPipeline(scaler, MODEL_FEATURES, engineer)
+    record = dict(records[0])
+    del record['V5']
+
+    with pytest.raises(ValueError, match="V5"):
+        pipeline.preprocess_one(record)
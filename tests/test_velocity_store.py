@@ -0,0 +1,102 @@
+"""
+Tests for the sliding-window velocity feature store
+"""
+import numpy as np
+import pandas as pd
+
+from src.utils.velocity_store import (
+    VelocityFeatureStore,
+    VELOCITY_FEATURES,
+    VELOCITY_WINDOWS,
+)
+from src.utils.feature_engineering import FeatureEngineer, RAW_FEATURES, MODEL_FEATURES
+from src.utils.preprocessing import PreprocessingPipeline
+
+
+def brute_force(keys, times, amounts):
+    """Features from all strictly earlier events of the same key"""
+    out = np.zeros((len(keys), len(VELOCITY_FEATURES)))
+    for i in range(len(keys)):
+        if keys[i] is None:
+            continue
+        for j in range(len(keys)):
+            earlier = times[j] < times[i] or (times[j] == times[i] and j < i)
+            if keys[j] != keys[i] or not earlier:
+                continue
+            for w, window in enumerate(VELOCITY_WINDOWS.values()):
+                if times[j] > times[i] - window:
+                    out[i, 2 * w] += 1
+                    out[i, 2 * w + 1] += amounts[j]
+    return out
+
+
+def make_events(n=300, n_keys=12, seed=0):
+    rng = np.random.default_rng(seed)
+    keys = [f"card-{k}" for k in rng.integers(0, n_keys, size=n)]
+    keys[::10] = [None] * len(keys[::10])
+    times = rng.uniform(0, 2 * 86400, size=n).round()
+    amounts = rng.exponential(88.0, size=n)
+    return keys, times, amounts
+
+
+def test_replay_matches_brute_force():
+    keys, times, amounts = make_events()
+
+    features = VelocityFeatureStore(events_per_key=256).replay(keys, times, amounts, batch_size=17)
+
+    np.testing.assert_allclose(features, brute_force(keys, times, amounts))
+
+
+def test_serving_matches_training_replay():
+    """Scoring events one batch at a time gives the training features"""
+    keys, times, amounts = make_events()
+    expected = VelocityFeatureStore().replay(keys, times, amounts)
+
+    store = VelocityFeatureStore()
+    order = np.argsort(times, kind='stable')
+    served = np.empty_like(expected)
+    for rows in np.array_split(order, 40):
+        served[rows] = store.process([keys[i] for i in rows], times[rows], amounts[rows])
+
+    np.testing.assert_allclose(served, expected)
+
+
+def test_memory_is_bounded():
+    store = VelocityFeatureStore(max_keys=8, events_per_key=4)
+    nbytes = store.nbytes
+
+    for t in range(100):
+        store.process([f"card-{t}"], [float(t)], [1.0])
+
+    assert len(store) == 8
+    assert store.evictions == 92
+    assert store.nbytes == nbytes
+
+
+def test_idle_keys_are_evicted():
+    store = VelocityFeatureStore(idle_ttl=3600.0)
+    store.update(["a", "b"], [0.0, 5000.0], [1.0, 1.0])
+
+    assert store.evict_idle(now=6000.0) == 1
+    assert len(store) == 1
+
+
+def test_pipeline_appends_velocity_features():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(size=(20, len(RAW_FEATURES))), columns=RAW_FEATURES)
+    df['Time'] = np.arange(20) * 10.0
+    df['Amount'] = 50.0
+    records = df.to_dict(orient="records")
+    for record in records:
+        record['card_id'] = "card-1"
+
+    pipeline = PreprocessingPipeline(
+        feature_names=MODEL_FEATURES + VELOCITY_FEATURES,
+        feature_engineer=FeatureEngineer().fit(df),
+        velocity_store=VelocityFeatureStore(),
+    )
+    X = pipeline.records_to_array(records)
+
+    assert X.shape == (20, len(MODEL_FEATURES) + len(VELOCITY_FEATURES))
+    # Last row: 5 earlier events within the minute, 19 within the hour
+    np.testing.assert_array_equal(X[-1, len(MODEL_FEATURES):], [5, 250, 19, 950, 19, 950])
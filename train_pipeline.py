@@ -16,6 +16,7 @@ from src.model.ensemble_predictor import EnsemblePredictor
 from src.model.model_loader import ModelLoader
 import numpy as np
 import joblib
+import json
 
 
 def main():
@@ -71,6 +72,9 @@ def main():
     joblib.dump(models['iso_forest'].model, models_dir / 'isolation_forest.joblib')
     joblib.dump(models['xgb_model'].pipeline, models_dir / 'xgboost.joblib')
     joblib.dump(data['scaler'], models_dir / 'scaler.joblib')
+    data['feature_engineer'].save(models_dir / 'feature_stats.json')
+    with open(models_dir / 'features_order.json', 'w') as f:
+        json.dump(data['feature_names'], f)
     
     config = {
         'iso_weight': ensemble.iso_weight,
@@ -87,6 +91,8 @@ def main():
     print(f"  - isolation_forest.joblib")
     print(f"  - xgboost.joblib")
     print(f"  - scaler.joblib")
+    print(f"  - feature_stats.json")
+    print(f"  - features_order.json")
     print(f"  - model_config.joblib")
     
     # Step 6: Load and Test